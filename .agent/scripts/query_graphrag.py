@@ -15,12 +15,17 @@ AGENT_DIR = Path(__file__).parent.parent
 GRAPH_FILE = AGENT_DIR / "graphrag" / "knowledge_graph.json"
 
 
+def read_graph():
+    """Parse the graph file; raises OSError / ValueError if it is missing or malformed."""
+    return json.loads(GRAPH_FILE.read_text())
+
+
 def load_graph():
     if not GRAPH_FILE.exists():
         print(f"Error: Graph file not found at {GRAPH_FILE}")
         sys.exit(1)
     try:
-        return json.loads(GRAPH_FILE.read_text())
+        return read_graph()
     except Exception as e:
         print(f"Error reading graph file: {e}")
         sys.exit(1)
@@ -47,6 +52,18 @@ def search_nodes(graph, query, limit=5):
     return sorted(results, key=lambda x: x["score"], reverse=True)[:limit]
 
 
+def run_query(query, limit=5):
+    """
+    In-process entry point (used by athena.tools.search).
+    Returns the JSON-serializable result list; [] if the graph is missing or unreadable.
+    """
+    try:
+        graph = read_graph()
+    except (OSError, ValueError):
+        return []
+    return search_nodes(graph, query, limit)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Query the Knowledge Graph")
     parser.add_argument("query", help="Search query")
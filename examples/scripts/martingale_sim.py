@@ -11,88 +11,246 @@ Parameters:
 - Simulations: 100,000
 """
 
-import random
-import statistics
 import sys
 import time
 
+import numpy as np
 
-def run_simulation(num_runs=10000, max_hands=3000, start_bankroll=100.0):
-    # Configuration
-    base_bet = 0.10
-    multipliers = [1, 2, 4, 8, 16]  # 0.10, 0.20, 0.40, 0.80, 1.60
-    bets = [base_bet * m for m in multipliers]
-    max_step = len(bets) - 1
-    win_prob = 0.495
+# Numba compiles the per-run loop to machine code (~30-100x faster).
+# Without it we fall back to a NumPy scan across all runs at once.
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+# With a CUDA GPU, every simulation runs as its own GPU thread instead.
+try:
+    from numba import cuda
+    from numba.cuda.random import create_xoroshiro128p_states, xoroshiro128p_uniform_float64
+
+    CUDA_AVAILABLE = cuda.is_available()
+except ImportError:
+    CUDA_AVAILABLE = False
+
+CUDA_THREADS_PER_BLOCK = 256
 
-    # Statistics storage
-    end_bankrolls = []
+
+@njit(cache=True, fastmath=True)
+def _simulate_one(max_hands, start_bankroll, win_prob, bets_arr, next_on_loss):
+    """Play one run of `max_hands` hands. Returns (end_bankroll, min_bankroll, ruined)."""
+    bankroll = start_bankroll
+    current_step = 0
+    min_b = bankroll
+    ruined = False
+
+    for _ in range(max_hands):
+        # Check if we can afford the current bet
+        current_bet = bets_arr[current_step]
+        if bankroll < current_bet:
+            ruined = True
+            break
+
+        # Simulate hand
+        # simplified: ignores Blackjack payouts and splits/doubles variance
+        # treats it as a binary outcome 1:1 bet
+        # Branchless update: outcomes are ~50/50, so branches would mispredict
+        win = int(np.random.random() < win_prob)
+        bankroll += current_bet * (2 * win - 1)
+        current_step = next_on_loss[current_step] * (1 - win)  # Reset on win
+        min_b = min(min_b, bankroll)
+
+        if bankroll <= 0:
+            ruined = True
+            break
+
+    # If ruined, we record 0 or actual remaining dust
+    if ruined and bankroll < 0:
+        bankroll = 0.0
+    return bankroll, min_b, ruined
+
+
+@njit(cache=True, parallel=True)
+def _simulate_many(num_runs, max_hands, start_bankroll, win_prob, bets_arr, next_on_loss):
+    """
+    Run independent simulations across all cores.
+
+    Returns (end_bankrolls, min_bankroll_sum, ruin_count): only end bankrolls
+    are kept per run (for percentiles); the rest are prange reductions.
+    """
+    end_bankrolls = np.empty(num_runs, dtype=np.float32)
+    min_sum = 0.0
     ruin_count = 0
-    min_bankrolls = []
 
-    start_time = time.time()
+    for i in prange(num_runs):
+        end_b, min_b, ruined = _simulate_one(
+            max_hands, start_bankroll, win_prob, bets_arr, next_on_loss
+        )
+        end_bankrolls[i] = end_b
+        min_sum += min_b
+        ruin_count += ruined
+
+    return end_bankrolls, min_sum, ruin_count
 
-    print(f"Running {num_runs} simulations...")
-    print(f"Parameters: Bankroll=${start_bankroll}, Hands={max_hands}, WinRate={win_prob:.1%}")
-    print("-" * 50)
 
-    for i in range(num_runs):
+if CUDA_AVAILABLE:
+
+    @cuda.jit
+    def _simulate_kernel(
+        rng_states,
+        max_hands,
+        start_bankroll,
+        win_prob,
+        bets_arr,
+        next_on_loss,
+        out_end,
+        out_totals,
+    ):
+        """Same state machine as _simulate_one; thread i owns simulation i."""
+        i = cuda.grid(1)
+        if i >= out_end.shape[0]:
+            return
+
         bankroll = start_bankroll
         current_step = 0
         min_b = bankroll
         ruined = False
 
         for _ in range(max_hands):
-            # Check if we can afford the current bet
-            current_bet = bets[current_step]
+            current_bet = bets_arr[current_step]
             if bankroll < current_bet:
                 ruined = True
                 break
 
-            # Simulate hand
-            # simplified: ignores Blackjack payouts and splits/doubles variance
-            # treats it as a binary outcome 1:1 bet
-            if random.random() < win_prob:
-                bankroll += current_bet
-                current_step = 0  # Reset on win
-            else:
-                bankroll -= current_bet
-                if current_step < max_step:
-                    current_step += 1
-                else:
-                    current_step = 0  # Reset after hitting max step loss (Stop Loss)
-
-            if bankroll < min_b:
-                min_b = bankroll
+            win = int(xoroshiro128p_uniform_float64(rng_states, i) < win_prob)
+            bankroll += current_bet * (2 * win - 1)
+            current_step = next_on_loss[current_step] * (1 - win)
+            min_b = min(min_b, bankroll)
 
             if bankroll <= 0:
                 ruined = True
                 break
 
+        if ruined and bankroll < 0:
+            bankroll = 0.0
+        out_end[i] = bankroll
+        # out_totals = [min_bankroll_sum, ruin_count]
+        cuda.atomic.add(out_totals, 0, min_b)
         if ruined:
-            ruin_count += 1
-            # If ruined, we record 0 or actual remaining dust
-            end_bankrolls.append(max(0, bankroll))
-        else:
-            end_bankrolls.append(bankroll)
+            cuda.atomic.add(out_totals, 1, 1.0)
+
+
+def _simulate_gpu(num_runs, max_hands, start_bankroll, win_prob, bets_arr, next_on_loss):
+    """Run all simulations in one CUDA kernel launch and copy the results back to the host."""
+    seed = int(np.random.default_rng().integers(2**63))
+    rng_states = create_xoroshiro128p_states(num_runs, seed=seed)
+    out_end = cuda.device_array(num_runs, dtype=np.float32)
+    out_totals = cuda.to_device(np.zeros(2, dtype=np.float64))
+
+    blocks = (num_runs + CUDA_THREADS_PER_BLOCK - 1) // CUDA_THREADS_PER_BLOCK
+    _simulate_kernel[blocks, CUDA_THREADS_PER_BLOCK](
+        rng_states,
+        max_hands,
+        start_bankroll,
+        win_prob,
+        cuda.to_device(bets_arr),
+        cuda.to_device(next_on_loss),
+        out_end,
+        out_totals,
+    )
+    min_sum, ruin_count = out_totals.copy_to_host()
+    return out_end.copy_to_host(), min_sum, int(ruin_count)
+
+
+def _simulate_vectorized(num_runs, max_hands, start_bankroll, win_prob, bets_arr, next_on_loss):
+    """
+    NumPy fallback: advance every run one hand at a time.
+
+    Instead of num_runs * max_hands interpreter iterations, each hand is a
+    handful of array ops of width num_runs, with finished runs masked out.
+    """
+    rng = np.random.default_rng()
+    bankroll = np.full(num_runs, start_bankroll, dtype=np.float64)
+    min_bankrolls = bankroll.copy()
+    step = np.zeros(num_runs, dtype=np.int64)
+    ruin_flags = np.zeros(num_runs, dtype=np.bool_)
+    active = np.ones(num_runs, dtype=np.bool_)
+
+    for _ in range(max_hands):
+        # Runs that can't afford the current bet are ruined
+        current_bet = bets_arr[step]
+        broke = active & (bankroll < current_bet)
+        ruin_flags |= broke
+        active &= ~broke
+        if not active.any():
+            break
+
+        wins = rng.random(num_runs) < win_prob
+        bankroll += active * current_bet * (2 * wins - 1)
+        # Reset on win, or after hitting max step loss (Stop Loss)
+        step = np.where(active, next_on_loss[step] * ~wins, step)
+        np.minimum(min_bankrolls, bankroll, out=min_bankrolls)
+
+        busted = active & (bankroll <= 0)
+        ruin_flags |= busted
+        active &= ~busted
+
+    # If ruined, we record 0 or actual remaining dust
+    end_bankrolls = np.where(ruin_flags, np.maximum(bankroll, 0.0), bankroll)
+    return end_bankrolls.astype(np.float32), min_bankrolls.sum(), int(ruin_flags.sum())
+
 
-        min_bankrolls.append(min_b)
+def run_simulation(num_runs=10000, max_hands=3000, start_bankroll=100.0):
+    # Configuration
+    base_bet = 0.10
+    multipliers = [1, 2, 4, 8, 16]  # 0.10, 0.20, 0.40, 0.80, 1.60
+    bets = [base_bet * m for m in multipliers]
+    bets_arr = np.asarray(bets, dtype=np.float64)
+    max_step = len(bets) - 1
+    # Step to move to after a loss: advance, or reset after the max step (Stop Loss).
+    # Built once here and shared by every backend.
+    next_on_loss = (np.arange(max_step + 1) + 1) % (max_step + 1)
+    win_prob = 0.495
+
+    print(f"Running {num_runs} simulations...")
+    print(f"Parameters: Bankroll=${start_bankroll}, Hands={max_hands}, WinRate={win_prob:.1%}")
+    if CUDA_AVAILABLE:
+        print("Backend: CUDA GPU")
+        simulate = _simulate_gpu
+    elif NUMBA_AVAILABLE:
+        simulate = _simulate_many
+    else:
+        print("⚠️  numba not installed. Using NumPy fallback. Run: pip install numba")
+        simulate = _simulate_vectorized
+    if simulate is not _simulate_vectorized:
+        # Warmup: 1-run call so JIT compilation is excluded from the timing
+        simulate(1, max_hands, start_bankroll, win_prob, bets_arr, next_on_loss)
+    print("-" * 50)
+
+    start_time = time.time()
 
-        if (i + 1) % 20000 == 0:
-            print(f"Completed {i + 1} runs...")
+    # Keep only what the report needs: float32 end bankrolls (percentiles) plus
+    # running totals for the drawdown mean and ruin count.
+    end_bankrolls, min_sum, ruin_count = simulate(
+        num_runs, max_hands, start_bankroll, win_prob, bets_arr, next_on_loss
+    )
 
     duration = time.time() - start_time
 
     # Analysis
-    avg_end = statistics.mean(end_bankrolls)
-    median_end = statistics.median(end_bankrolls)
+    avg_end = end_bankrolls.mean(dtype=np.float64)
+    median_end = np.median(end_bankrolls)
     ror = (ruin_count / num_runs) * 100
 
-    # Sort for percentiles
-    sorted_ends = sorted(end_bankrolls)
-    worst_1_percent = sorted_ends[int(num_runs * 0.01)]
-    worst_5_percent = sorted_ends[int(num_runs * 0.05)]
-    best_1_percent = sorted_ends[int(num_runs * 0.99)]
+    # Percentiles via partial partition (O(n)) rather than a full sort
+    ranks = [int(num_runs * 0.01), int(num_runs * 0.05), int(num_runs * 0.99)]
+    worst_1_percent, worst_5_percent, best_1_percent = np.partition(end_bankrolls, ranks)[ranks]
 
     print("=" * 50)
     print("SIMULATION RESULTS")
@@ -107,7 +265,7 @@ def run_simulation(num_runs=10000, max_hands=3000, start_bankroll=100.0):
     print(f"Worst 1% Case:    ${worst_1_percent:.2f}")
     print(f"Worst 5% Case:    ${worst_5_percent:.2f}")
     print(f"Best 1% Case:     ${best_1_percent:.2f}")
-    print(f"Max Drawdown (Avg): ${start_bankroll - statistics.mean(min_bankrolls):.2f}")
+    print(f"Max Drawdown (Avg): ${start_bankroll - min_sum / num_runs:.2f}")
     print("=" * 50)
     print(f"Time taken: {duration:.2f}s")
 
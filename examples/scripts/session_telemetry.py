@@ -18,13 +18,25 @@ Note: Actual token counts require API access. This script estimates based on:
 
 import os
 import sys
-import glob
 import datetime
+import functools
+import hashlib
+import importlib.util
+import json
+import re
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 # Configuration
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 SESSION_LOG_DIR = os.path.join(PROJECT_ROOT, ".context", "memories", "session_logs")
 BOOT_FILE_PATH = os.path.join(PROJECT_ROOT, ".framework", "v7.0", "modules", "Core_Identity.md")
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "athena")
+TOKEN_CACHE_PATH = os.path.join(CACHE_DIR, "token_counts.json")
+# The live session log gets a new content hash on every edit, so keep only the newest entries
+TOKEN_CACHE_MAX_ENTRIES = 256
+TOKENIZER_MODEL = "gpt-4"
 
 # ANSI Colors
 CYAN = "\033[96m"
@@ -45,40 +57,138 @@ PRICING = {
 # Default model for estimates
 DEFAULT_MODEL = "opus_4.5"
 
+# Protocol commands tracked in session logs (report order)
+PROTOCOLS = [
+    "/ultrathink",
+    "/think",
+    "/needful",
+    "/audit",
+    "/search",
+    "/research",
+    "/graph",
+    "/end",
+    "/start",
+]
+# Session multipliers indexed by min(count, 3): 0 = light, 1-2 = medium, 3+ = heavy
+COMPLEXITY_BONUS = (1.0, 1.5, 1.5, 2.0)  # by artifacts created
+PROTOCOL_BONUS = (1.0, 1.2, 1.2, 1.5)  # by distinct deep-work protocols invoked
+
+# One alternation so the log is scanned once instead of once per protocol
+_PROTO_RE = re.compile("(" + "|".join(re.escape(p) for p in PROTOCOLS) + r")\b", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoder():
+    """
+    Builds the tiktoken encoder once per process (BPE table construction is slow).
+    Returns None if tiktoken is not installed.
+    """
+    # Persist downloaded BPE ranks instead of relying on the temp dir
+    os.environ.setdefault("TIKTOKEN_CACHE_DIR", os.path.join(CACHE_DIR, "tiktoken"))
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    return tiktoken.encoding_for_model(TOKENIZER_MODEL)
+
 
 def estimate_tokens(text):
     """
     Estimates token count.
     Uses tiktoken if available, otherwise ~4 chars per token approximation.
     """
+    enc = _get_encoder()
+    if enc is None:
+        return len(text) // 4
+    return len(enc.encode(text))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_token_cache():
+    """
+    Loads the persistent {"<content hash>:<model>": token_count} map.
+    """
     try:
-        import tiktoken
+        with open(TOKEN_CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_token_cache(cache):
+    # Dicts keep insertion order: drop the oldest entries past the cap
+    excess = len(cache) - TOKEN_CACHE_MAX_ENTRIES
+    if excess > 0:
+        for key in list(cache)[:excess]:
+            del cache[key]
+    tmp_path = f"{TOKEN_CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, TOKEN_CACHE_PATH)  # Readers never see a half-written file
+    except OSError:
+        pass  # Cache is best-effort
 
-        enc = tiktoken.encoding_for_model("gpt-4")
-        return len(enc.encode(text))
-    except ImportError:
-        return len(text) // 4
+
+def _count_tokens_cached(data, text=None):
+    """
+    Token count for raw file bytes, memoized by content hash so unchanged
+    files skip the BPE pass entirely (also across process restarts).
+    Pass `text` if the caller has already decoded `data`.
+    """
+    # Approximate counts must not be served once tiktoken is installed (and vice versa)
+    model = TOKENIZER_MODEL if importlib.util.find_spec("tiktoken") else "approx"
+    key = f"{hashlib.blake2b(data, digest_size=16).hexdigest()}:{model}"
+    cache = _load_token_cache()
+    if key not in cache:
+        cache[key] = estimate_tokens(text if text is not None else data.decode("utf-8"))
+        _save_token_cache(cache)
+    return cache[key]
 
 
 def get_file_tokens(path):
     if not os.path.exists(path):
         return 0
-    with open(path, "r", encoding="utf-8") as f:
-        return estimate_tokens(f.read())
+    with open(path, "rb") as f:
+        return _count_tokens_cached(f.read())
 
 
 def get_latest_session_log():
-    files = glob.glob(os.path.join(SESSION_LOG_DIR, "*.md"))
-    if not files:
+    # One scandir pass: is_file() comes from the dirent type (no syscall on POSIX),
+    # so only .md files pay the stat() call for st_ctime
+    try:
+        with os.scandir(SESSION_LOG_DIR) as it:
+            latest = max(
+                (e for e in it if e.name.endswith(".md") and e.is_file()),
+                key=lambda e: e.stat().st_ctime,
+                default=None,
+            )
+    except FileNotFoundError:
         return None
-    return max(files, key=os.path.getctime)
+    return latest.path if latest else None
+
+
+def _count_today_in(dir_path, today_start, today_end):
+    if not os.path.exists(dir_path):
+        return 0
+    with os.scandir(dir_path) as it:
+        return sum(
+            1
+            for e in it
+            if e.is_file() and today_start <= e.stat(follow_symlinks=False).st_mtime < today_end
+        )
 
 
 def count_artifacts_created_today():
     """
     Count artifacts created today by checking file modification times.
     """
+    # Local-midnight bounds as epoch seconds: a float compare per file, no date objects
     today = datetime.date.today()
+    today_start = time.mktime(today.timetuple())
+    # Next midnight rather than +86400 so DST-change days are still exact
+    today_end = time.mktime((today + datetime.timedelta(days=1)).timetuple())
     artifact_dirs = [
         os.path.join(PROJECT_ROOT, ".context", "memories", "case_studies"),
         os.path.join(PROJECT_ROOT, ".context", "cases"),
@@ -86,44 +196,21 @@ def count_artifacts_created_today():
         os.path.join(PROJECT_ROOT, ".context", "playbooks"),
         os.path.join(PROJECT_ROOT, ".context", "scenarios"),
     ]
-    count = 0
-    for dir_path in artifact_dirs:
-        if os.path.exists(dir_path):
-            for f in os.listdir(dir_path):
-                fp = os.path.join(dir_path, f)
-                if os.path.isfile(fp):
-                    mtime = datetime.date.fromtimestamp(os.path.getmtime(fp))
-                    if mtime == today:
-                        count += 1
-    return count
+    # Directory scans are I/O-latency bound (GIL released in syscalls): run them concurrently
+    with ThreadPoolExecutor(max_workers=len(artifact_dirs)) as ex:
+        return sum(ex.map(lambda d: _count_today_in(d, today_start, today_end), artifact_dirs))
 
 
 def detect_protocol_invocations(content):
     """
     Detect protocol invocations from session log content.
     """
-    import re
-
-    protocols = [
-        "/ultrathink",
-        "/think",
-        "/needful",
-        "/audit",
-        "/search",
-        "/research",
-        "/graph",
-        "/end",
-        "/start",
-    ]
-    found = []
-    for p in protocols:
-        matches = re.findall(re.escape(p), content, re.IGNORECASE)
-        if matches:
-            found.append(f"{p} x{len(matches)}")
+    counts = Counter(m.lower() for m in _PROTO_RE.findall(content))
+    found = [f"{p} x{counts[p]}" for p in PROTOCOLS if counts[p]]
     return ", ".join(found) if found else "None"
 
 
-def estimate_session_tokens(session_log_tokens, artifacts_created, protocols_invoked):
+def estimate_session_tokens(session_log_tokens, artifacts_created, protocol_count):
     """
     Estimate actual session token usage based on multiple signals.
 
@@ -136,27 +223,14 @@ def estimate_session_tokens(session_log_tokens, artifacts_created, protocols_inv
     Signals used:
     1. Session log size (base)
     2. Artifacts created (more artifacts = more complex session)
-    3. Protocols invoked (deep work = more tokens)
+    3. Distinct protocols invoked (deep work = more tokens)
     """
     # Base multiplier
     BASE_MULTIPLIER = 15
 
-    # Adjust for session complexity
-    if artifacts_created >= 3:
-        complexity_bonus = 2.0  # Heavy session
-    elif artifacts_created >= 1:
-        complexity_bonus = 1.5  # Medium session
-    else:
-        complexity_bonus = 1.0  # Light session
-
-    # Adjust for deep work protocols
-    protocol_count = protocols_invoked.count("x") if protocols_invoked != "None" else 0
-    if protocol_count >= 3:
-        protocol_bonus = 1.5
-    elif protocol_count >= 1:
-        protocol_bonus = 1.2
-    else:
-        protocol_bonus = 1.0
+    # Adjust for session complexity and deep work protocols
+    complexity_bonus = COMPLEXITY_BONUS[min(artifacts_created, 3)]
+    protocol_bonus = PROTOCOL_BONUS[min(protocol_count, 3)]
 
     # Minimum floor based on typical session
     # User feedback: $1 is the MOST conservative for a real session
@@ -198,19 +272,21 @@ def main():
         sys.exit(1)
 
     session_filename = os.path.basename(session_log_path)
-    session_log_tokens = get_file_tokens(session_log_path)
 
-    # 3. Read session log for protocol detection
-    with open(session_log_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    # 3. Read session log once for both token count and protocol detection
+    with open(session_log_path, "rb") as f:
+        data = f.read()
+    content = data.decode("utf-8")
+    session_log_tokens = _count_tokens_cached(data, content)
 
     # 4. Count artifacts and protocols
     artifacts_created = count_artifacts_created_today()
     protocols_invoked = detect_protocol_invocations(content)
+    protocol_count = protocols_invoked.count("x") if protocols_invoked != "None" else 0
 
     # 5. Estimate actual session tokens (not just the log)
     estimated_input, estimated_output = estimate_session_tokens(
-        session_log_tokens, artifacts_created, protocols_invoked
+        session_log_tokens, artifacts_created, protocol_count
     )
     total_estimated = estimated_input + estimated_output
 
@@ -167,7 +167,7 @@ def main():
     from athena.boot import create_default_orchestrator
 
     orchestrator = create_default_orchestrator()
-    success = orchestrator.execute(parallel_phases=[4, 5])
+    success = orchestrator.execute(parallel_phases=[4, 5, 6])
     sys.exit(0 if success else 1)
 
 
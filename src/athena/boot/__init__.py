@@ -1,5 +1,13 @@
 """Athena Boot Module"""
 
-from .orchestrator import BootOrchestrator, create_default_orchestrator
-
 __all__ = ["BootOrchestrator", "create_default_orchestrator"]
+
+
+def __getattr__(name):
+    # PEP 562 lazy loading: `import athena.boot` stays cheap until the
+    # orchestrator is actually used.
+    if name in __all__:
+        from . import orchestrator
+
+        return getattr(orchestrator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,12 +8,78 @@ and semantic memory priming.
 This is the FUNCTIONAL version that creates real artifacts.
 """
 
-import hashlib
+import functools
+import io
+import os
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from heapq import nlargest
+from itertools import chain
 from pathlib import Path
 from typing import Callable, List, Tuple, Optional
 
+# Any of these in a directory marks it as the project root
+_ROOT_MARKERS = frozenset({".athena_root", ".athena", "pyproject.toml", ".git"})
+
+# New session log, pre-encoded; only the session id and creation time vary
+_SESSION_TEMPLATE = b"""# Session Log: %b
+
+> **Created**: %b
+> **Status**: Active
+
+## Summary
+
+(Session in progress...)
+
+## Key Decisions
+
+-
+
+## Insights
+
+-
+
+---
+*Auto-generated by Athena Boot Orchestrator*
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _discover_root_from(cwd_str: str) -> Path:
+    """Walk up from cwd_str; one directory listing per level instead of 4 stats."""
+    current = Path(cwd_str)
+    for parent in [current] + list(current.parents):
+        try:
+            with os.scandir(parent) as it:
+                if any(entry.name in _ROOT_MARKERS for entry in it):
+                    return parent
+        except OSError:
+            continue
+    return current
+
+
+class _PhaseOutput(io.TextIOBase):
+    """
+    sys.stdout stand-in while a parallel phase group runs: writes from a thread
+    that is capturing go to its own buffer, everything else passes through.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def capture(self, buffer: Optional[io.StringIO]):
+        self._local.buffer = buffer
+
+    def write(self, text: str) -> int:
+        return (getattr(self._local, "buffer", None) or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
 
 class BootOrchestrator:
     """
@@ -22,13 +88,13 @@ class BootOrchestrator:
     The boot sequence consists of 7 phases:
     1. Watchdog activation (verify core files exist)
     2. System sync (check directory structure)
-    3. Semantic prime verification (SHA-384 hash check)
+    3. Semantic prime verification (BLAKE2b fingerprint)
     4. Session creation (create new session log)
     5. Context capture (load last session summary)
     6. Semantic memory priming (query vector DB if available)
     7. Identity loading (load Core_Identity.md)
 
-    Phases 6 & 7 run in parallel for performance optimization.
+    Phases 5-7 are I/O-bound and independent, so they run in parallel.
     """
 
     def __init__(self, project_root: Optional[Path] = None):
@@ -44,13 +110,27 @@ class BootOrchestrator:
 
     def _discover_root(self) -> Path:
         """Discover project root by looking for .athena_root or pyproject.toml."""
-        current = Path.cwd()
-        for parent in [current] + list(current.parents):
-            if (parent / ".athena_root").exists() or (parent / ".athena").exists():
-                return parent
-            if (parent / "pyproject.toml").exists() or (parent / ".git").exists():
-                return parent
-        return current
+        return _discover_root_from(str(Path.cwd()))
+
+    @staticmethod
+    def _run_phase(
+        executor: Callable, output: Optional[_PhaseOutput] = None
+    ) -> Tuple[object, Optional[Exception], str]:
+        """
+        Run one phase executor, returning (result, error, captured output) instead
+        of raising. With `output` installed as sys.stdout, its prints are buffered.
+        """
+        buffer = io.StringIO()
+        if output is not None:
+            output.capture(buffer)
+        try:
+            result, error = executor(), None
+        except Exception as e:
+            result, error = None, e
+        finally:
+            if output is not None:
+                output.capture(None)
+        return result, error, buffer.getvalue()
 
     def register_phase(self, name: str, executor: Callable):
         """Register a boot phase with its executor function."""
@@ -62,37 +142,63 @@ class BootOrchestrator:
 
         Args:
             parallel_phases: List of phase indices to run in parallel
-                             (e.g., [5, 6] to run phases 6 & 7 concurrently)
+                             (e.g., [4, 5, 6] to run phases 5-7 concurrently).
+                             Adjacent indices form one concurrent group.
 
         Returns:
             True if boot completed successfully, False otherwise.
         """
         start_time = time.time()
-        parallel_phases = parallel_phases or []
+        parallel_phases = set(parallel_phases or [])
+        total = len(self.phases)
 
         print("━" * 60)
         print("⚡ ATHENA BOOT SEQUENCE")
         print("━" * 60)
 
-        for i, (name, executor) in enumerate(self.phases):
-            phase_num = i + 1
-            try:
+        # Group consecutive parallel phases; everything else runs alone, in order
+        groups: List[List[int]] = []
+        for i in range(total):
+            if groups and i in parallel_phases and i - 1 in parallel_phases:
+                groups[-1].append(i)
+            else:
+                groups.append([i])
+
+        for group in groups:
+            for i in group:
+                name = self.phases[i][0]
                 if i in parallel_phases:
-                    print(f"[{phase_num}/{len(self.phases)}] ⚡ {name} (parallel)")
+                    print(f"[{i + 1}/{total}] ⚡ {name} (parallel)")
                 else:
-                    print(f"[{phase_num}/{len(self.phases)}] ⏳ {name}")
-
-                result = executor()
-
+                    print(f"[{i + 1}/{total}] ⏳ {name}")
+
+            if len(group) == 1:
+                results = [self._run_phase(self.phases[group[0]][1])]
+            else:
+                # Buffer each phase's prints and replay them in phase order below,
+                # so concurrent phases don't interleave on the console
+                output = _PhaseOutput(sys.stdout)
+                sys.stdout = output
+                try:
+                    with ThreadPoolExecutor(max_workers=len(group)) as pool:
+                        futures = [
+                            pool.submit(self._run_phase, self.phases[i][1], output) for i in group
+                        ]
+                        results = [f.result() for f in futures]
+                finally:
+                    sys.stdout = output.stream
+
+            for i, (result, error, captured) in zip(group, results):
+                name = self.phases[i][0]
+                if captured:
+                    sys.stdout.write(captured)
+                if error is not None:
+                    print(f"❌ Boot error in {name}: {error}")
+                    return False
                 if result is False:
                     print(f"❌ Boot failed at phase: {name}")
                     return False
-
-                print(f"[{phase_num}/{len(self.phases)}] ✅ {name}")
-
-            except Exception as e:
-                print(f"❌ Boot error in {name}: {e}")
-                return False
+                print(f"[{i + 1}/{total}] ✅ {name}")
 
         self.boot_time = time.time() - start_time
         print("━" * 60)
@@ -146,13 +252,15 @@ def create_functional_orchestrator(project_root: Optional[Path] = None) -> BootO
     # --- Phase 3: Semantic Prime Verification ---
     def semantic_prime():
         """Check integrity of core identity."""
+        import hashlib
+
         from athena.core.config import FRAMEWORK_DIR
         
         identity_file = FRAMEWORK_DIR / "v8.2-stable" / "modules" / "Core_Identity.md"
 
         if identity_file.exists():
-            content = identity_file.read_text(encoding="utf-8")
-            hash_val = hashlib.sha256(content.encode()).hexdigest()[:12]
+            # Display-only fingerprint: blake2b over raw bytes (no decode/re-encode)
+            hash_val = hashlib.blake2b(identity_file.read_bytes(), digest_size=6).hexdigest()
             print(f"   🔐 Identity hash: {hash_val}")
         else:
             print("   ⚠️  Core_Identity.md not found in framework")
@@ -168,36 +276,24 @@ def create_functional_orchestrator(project_root: Optional[Path] = None) -> BootO
         target_dir = legacy_dir if legacy_dir.exists() else orchestrator.session_logs_dir
         
         target_dir.mkdir(parents=True, exist_ok=True)
-        today = datetime.now().strftime("%Y-%m-%d")
+        # One timestamp so the filename date and "Created" always agree
+        now = datetime.now()
+        today = now.strftime("%Y-%m-%d")
 
-        # Find next session number for today
-        existing = list(target_dir.glob(f"{today}-session-*.md"))
-        next_num = len(existing) + 1
+        # Find next session number for today (count only; no Path objects or fnmatch)
+        prefix = f"{today}-session-"
+        with os.scandir(target_dir) as it:
+            next_num = (
+                sum(1 for e in it if e.name.startswith(prefix) and e.name.endswith(".md")) + 1
+            )
 
         session_id = f"{today}-session-{next_num:02d}"
         session_file = target_dir / f"{session_id}.md"
 
         # Create session log
-        session_file.write_text(f"""# Session Log: {session_id}
-
-> **Created**: {datetime.now().isoformat()}
-> **Status**: Active
-
-## Summary
-
-(Session in progress...)
-
-## Key Decisions
-
--
-
-## Insights
-
--
-
----
-*Auto-generated by Athena Boot Orchestrator*
-""", encoding="utf-8")
+        payload = _SESSION_TEMPLATE % (session_id.encode(), now.isoformat().encode())
+        with open(session_file, "wb") as f:
+            f.write(payload)
         orchestrator.session_id = session_id
         print(f"   📝 Created: {session_file.name}")
         return True
@@ -210,12 +306,13 @@ def create_functional_orchestrator(project_root: Optional[Path] = None) -> BootO
         legacy_dir = root / "session_logs"
         
         # Collect from all possible locations
-        all_sessions = list(orchestrator.session_logs_dir.glob("*.md"))
+        all_sessions = orchestrator.session_logs_dir.glob("*.md")
         if legacy_dir.exists():
-            all_sessions.extend(list(legacy_dir.glob("*.md")))
-            
-        sessions = sorted(all_sessions, reverse=True)
-        
+            all_sessions = chain(all_sessions, legacy_dir.glob("*.md"))
+
+        # Only the two newest are needed; names are date-prefixed
+        sessions = nlargest(2, all_sessions, key=lambda p: p.name)
+
         if len(sessions) > 1:
             last = sessions[1]  # Skip the one we just created
             orchestrator.last_session = last.stem
@@ -266,4 +363,4 @@ def create_default_orchestrator() -> BootOrchestrator:
 
 if __name__ == "__main__":
     orchestrator = create_functional_orchestrator()
-    orchestrator.execute(parallel_phases=[4, 5])  # Run phases 6 & 7 in parallel
+    orchestrator.execute(parallel_phases=[4, 5, 6])  # Run phases 5-7 in parallel
@@ -7,6 +7,7 @@ A production-grade LRU cache with semantic similarity matching.
 Features:
     - Exact Match: Hash-based O(1) lookup for identical queries
     - Semantic Match: Cosine similarity search for semantically similar queries
+      (a repeated embedding is found in O(1) via its float32-packed bytes)
     - TTL Expiration: Entries expire after configurable time period
     - Disk Persistence: Cache survives process restarts
 
@@ -29,6 +30,7 @@ import hashlib
 import json
 import math
 import time
+from array import array
 from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -44,6 +46,8 @@ class CacheEntry:
     timestamp: float
     hits: int = 0
     embedding: list[float] | None = field(default=None)
+    # float32-packed embedding, the key into QueryCache._embedding_index (not persisted)
+    embedding_key: bytes | None = field(default=None, repr=False)
 
 
 class QueryCache:
@@ -59,6 +63,7 @@ class QueryCache:
         self.max_size = max_size
         self._cache_file = cache_dir / "search_cache.json"
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._embedding_index: dict[bytes, str] = {}  # packed embedding -> cache key
         self._load_from_disk()
 
     def _hash_key(self, query: str) -> str:
@@ -66,6 +71,21 @@ class QueryCache:
         normalized = query.lower().strip()
         return hashlib.md5(normalized.encode()).hexdigest()[:16]
 
+    @staticmethod
+    def _embedding_key(embedding: list[float]) -> bytes:
+        """Pack an embedding as float32 bytes: a compact key hashed in one C call."""
+        return array("f", embedding).tobytes()
+
+    def _index_entry(self, key: str, entry: CacheEntry) -> None:
+        if entry.embedding:
+            entry.embedding_key = self._embedding_key(entry.embedding)
+            self._embedding_index[entry.embedding_key] = key
+
+    def _unindex_entry(self, key: str, entry: CacheEntry) -> None:
+        emb_key = entry.embedding_key
+        if emb_key is not None and self._embedding_index.get(emb_key) == key:
+            del self._embedding_index[emb_key]
+
     def _load_from_disk(self):
         """Load cache from disk on initialization."""
         if not self._cache_file.exists():
@@ -78,6 +98,7 @@ class QueryCache:
                     if "embedding" not in entry_data:
                         entry_data["embedding"] = None
                     self._cache[key] = CacheEntry(**entry_data)
+                    self._index_entry(key, self._cache[key])
         except Exception:
             pass
 
@@ -114,6 +135,7 @@ class QueryCache:
 
         if now - entry.timestamp > self.ttl_seconds:
             del self._cache[key]
+            self._unindex_entry(key, entry)
             self._save_to_disk()
             return None
 
@@ -155,6 +177,15 @@ class QueryCache:
         Returns:
             Cached result if similar query found, else None
         """
+        # Identical embedding (repeat query): O(1) lookup, no similarity scan
+        key = self._embedding_index.get(self._embedding_key(target_embedding))
+        entry = self._cache.get(key) if key is not None else None
+        if entry is not None:
+            entry.hits += 1
+            self._cache.move_to_end(key)
+            self._save_to_disk()
+            return entry.value
+
         best_sim = -1.0
         best_entry = None
         best_key = None
@@ -183,21 +214,28 @@ class QueryCache:
         """Cache a result with optional embedding for semantic retrieval."""
         key = self._hash_key(query)
 
+        previous = self._cache.pop(key, None)
+        if previous is not None:
+            self._unindex_entry(key, previous)
+
         # Evict oldest if at capacity (LRU)
         while len(self._cache) >= self.max_size:
-            self._cache.popitem(last=False)
+            self._unindex_entry(*self._cache.popitem(last=False))
 
-        self._cache[key] = CacheEntry(
+        entry = CacheEntry(
             value=value,
             timestamp=time.time(),
             hits=0,
             embedding=embedding,
         )
+        self._cache[key] = entry
+        self._index_entry(key, entry)
         self._save_to_disk()
 
     def invalidate(self) -> None:
         """Invalidate all cached results (call when underlying data changes)."""
         self._cache.clear()
+        self._embedding_index.clear()
         self._save_to_disk()
 
     def stats(self) -> dict:
@@ -7,7 +7,11 @@ Centralized configuration and path discovery.
 
 from pathlib import Path
 from typing import Optional
+import functools
+from itertools import chain
 import os
+import re
+import time
 
 
 # Global Cache for PROJECT_ROOT
@@ -25,18 +29,25 @@ def get_project_root() -> Path:
 
     # Start from this file
     current = Path(__file__).resolve()
-    
-    # Priority 1: Check for .athena_root (User project marker)
-    for parent in current.parents:
-        if (parent / ".athena_root").exists() or (parent / ".athena").exists():
-             _PROJECT_ROOT_CACHE = parent
-             return parent
 
-    # Priority 2: Check for pyproject.toml (The Athena-Public repo itself)
+    # Single walk, one directory listing per parent:
+    # Priority 1: .athena_root / .athena (User project marker) anywhere above
+    # Priority 2: nearest pyproject.toml (The Athena-Public repo itself)
+    pyproject_parent = None
     for parent in current.parents:
-        if (parent / "pyproject.toml").exists():
+        try:
+            names = set(os.listdir(parent))
+        except OSError:
+            continue
+        if ".athena_root" in names or ".athena" in names:
             _PROJECT_ROOT_CACHE = parent
             return parent
+        if pyproject_parent is None and "pyproject.toml" in names:
+            pyproject_parent = parent
+
+    if pyproject_parent is not None:
+        _PROJECT_ROOT_CACHE = pyproject_parent
+        return pyproject_parent
 
     # Fallback to current environment variable or CWD
     root = os.getenv("ATHENA_ROOT")
@@ -95,11 +106,39 @@ EXTENDED_DIRS = [
     (PROJECT_ROOT / "Reflection Essay", "case_studies"),
 ]
 
+# Bumped by invalidate_active_memory_paths() to expire the cached listing
+_ACTIVE_MEMORY_GENERATION = 0
+# Directories created by other processes (boot sync, `athena init`) can't bump the
+# generation, so long-lived processes also re-check existence this often (seconds)
+ACTIVE_MEMORY_TTL = 5.0
+
+
+@functools.lru_cache(maxsize=1)
+def _active_memory_paths(generation: int, ttl_bucket: int) -> tuple:
+    # Dedupe on strings (cheap hash/compare), Path only at the edge
+    seen: set[str] = set()
+    existing = []
+    for p in chain(CORE_DIRS.values(), (p for p, _ in EXTENDED_DIRS)):
+        s = os.fspath(p)
+        if s not in seen:
+            seen.add(s)
+            if os.path.exists(s):
+                existing.append(s)
+    existing.sort()
+    return tuple(Path(s) for s in existing)
+
+
 def get_active_memory_paths():
-    """Returns a deduplicated list of all active memory directory Paths."""
-    paths = [p for p in CORE_DIRS.values() if p.exists()]
-    paths.extend([p for p, _ in EXTENDED_DIRS if p.exists()])
-    return sorted(list(set(paths)))
+    """Returns a deduplicated list of all active memory directory Paths (cached)."""
+    ttl_bucket = int(time.monotonic() // ACTIVE_MEMORY_TTL)
+    return list(_active_memory_paths(_ACTIVE_MEMORY_GENERATION, ttl_bucket))
+
+
+def invalidate_active_memory_paths():
+    """Expire the cached result of get_active_memory_paths (call after creating memory dirs)."""
+    global _ACTIVE_MEMORY_GENERATION
+    _ACTIVE_MEMORY_GENERATION += 1
+
 
 # Key Files
 TAG_INDEX_PATH = CONTEXT_DIR / "TAG_INDEX.md"
@@ -107,18 +146,24 @@ TAG_INDEX_AM_PATH = CONTEXT_DIR / "TAG_INDEX_A-M.md"
 TAG_INDEX_NZ_PATH = CONTEXT_DIR / "TAG_INDEX_N-Z.md"
 CANONICAL_PATH = CONTEXT_DIR / "CANONICAL.md"
 
+_SESSION_PAT = re.compile(r"(\d{4}-\d{2}-\d{2})-session-(\d{2,3})\.md")
+
+
 def get_current_session_log() -> Optional[Path]:
-    if not SESSIONS_DIR.exists():
-        return None
-    import re
-    pattern = re.compile(r"(\d{4}-\d{2}-\d{2})-session-(\d{2,3})\.md")
-    session_files = []
-    for f in SESSIONS_DIR.glob("*.md"):
-        match = pattern.match(f.name)
-        if match:
-            date_str, session_num = match.groups()
-            session_files.append((date_str, int(session_num), f))
-    if not session_files:
+    # Single scandir pass keeping the newest (date, number); no list, no sort,
+    # and only the winner becomes a Path
+    best_key = None
+    best_name = None
+    try:
+        with os.scandir(SESSIONS_DIR) as it:
+            for entry in it:
+                if not entry.name.endswith(".md"):
+                    continue
+                match = _SESSION_PAT.match(entry.name)
+                if match:
+                    key = (match.group(1), int(match.group(2)))
+                    if best_key is None or key > best_key:
+                        best_key, best_name = key, entry.name
+    except OSError:
         return None
-    session_files.sort(key=lambda x: (x[0], x[1]), reverse=True)
-    return session_files[0][2]
+    return SESSIONS_DIR / best_name if best_name else None
@@ -5,11 +5,16 @@ Enforces the Triple-Lock protocol (Semantic Search → Web Search → Quicksave)
 to ensure all AI interactions are properly grounded before checkpointing.
 """
 
-import json
+import struct
 import time
 from pathlib import Path
 from typing import Dict, Any
 
+# On-disk exchange state: one flag byte + last search time (float64)
+_STATE_FORMAT = "<Bd"
+_SEMANTIC_BIT = 0b10
+_WEB_BIT = 0b01
+
 
 class GovernanceEngine:
     """
@@ -24,25 +29,33 @@ class GovernanceEngine:
 
     def __init__(self, state_dir: Path = None):
         self.state_dir = state_dir or Path.home() / ".athena" / "state"
-        self.state_file = self.state_dir / "exchange_state.json"
+        self.state_file = self.state_dir / "exchange_state.bin"
         self._state: Dict[str, Any] = self._load_state()
 
     def _load_state(self) -> Dict[str, Any]:
-        if self.state_file.exists():
-            try:
-                return json.loads(self.state_file.read_text())
-            except Exception:
-                pass
+        try:
+            flags, last_search_time = struct.unpack(_STATE_FORMAT, self.state_file.read_bytes())
+        except (OSError, struct.error):
+            flags, last_search_time = 0, 0
         return {
-            "semantic_search_performed": False,
-            "web_search_performed": False,
-            "last_search_time": 0,
+            "semantic_search_performed": bool(flags & _SEMANTIC_BIT),
+            "web_search_performed": bool(flags & _WEB_BIT),
+            "last_search_time": last_search_time,
         }
 
     def _save_state(self):
+        """
+        Write the state through on every change: another process (e.g. quicksave) may
+        have reset the file since our last write, so in-memory state can't gate writes.
+        """
+        flags = (_SEMANTIC_BIT if self._state["semantic_search_performed"] else 0) | (
+            _WEB_BIT if self._state["web_search_performed"] else 0
+        )
         try:
             self.state_dir.mkdir(parents=True, exist_ok=True)
-            self.state_file.write_text(json.dumps(self._state))
+            self.state_file.write_bytes(
+                struct.pack(_STATE_FORMAT, flags, self._state["last_search_time"])
+            )
         except Exception:
             pass
 
@@ -216,3 +216,16 @@ def search_system_docs(client, query_embedding, limit=5, threshold=0.3):
 def search_insights(client, query_embedding, limit=5, threshold=0.3):
     """Search insights table (Marketing Analysis, Strategic Notes)."""
     return search_rpc("search_insights", query_embedding, limit, threshold)
+
+
+def search_all(client, query_embedding, limits: Dict[str, Dict[str, float]]) -> List[Dict]:
+    """
+    Run every per-type search in one `rpc_search_all` call.
+
+    `limits` maps type -> {"count": n, "threshold": t}. Returns rows of
+    {"type": ..., "data": {...}} where `data` is the per-type search row.
+    """
+    result = client.rpc(
+        "rpc_search_all", {"query_embedding": query_embedding, "limits": limits}
+    ).execute()
+    return result.data
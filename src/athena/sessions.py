@@ -10,7 +10,12 @@ from pathlib import Path
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
-from athena.core.config import get_current_session_log, CONTEXT_DIR, SESSIONS_DIR
+from athena.core.config import (
+    get_current_session_log,
+    invalidate_active_memory_paths,
+    CONTEXT_DIR,
+    SESSIONS_DIR,
+)
 
 
 def parse_yaml_frontmatter(content: str) -> tuple[Dict[str, Any], int]:
@@ -216,7 +221,9 @@ lambda_coverage_d:
 #session #...
 """
 
-    SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
+    if not SESSIONS_DIR.exists():
+        SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
+        invalidate_active_memory_paths()  # Sessions dir just became an active memory path
     filepath.write_text(template, encoding="utf-8")
 
     if prev_session_id:
@@ -7,13 +7,24 @@ Integrates Canonical, Tags, Vectors, and Filesystem.
 """
 
 import argparse
+import atexit
 import contextlib
+import functools
+import heapq
+import importlib.util
 import json
-import subprocess
+import os
+import re
 import sys
+import threading
+import time
+from bisect import bisect_right
+from itertools import accumulate, islice
+from operator import itemgetter
 from pathlib import Path
-from collections import defaultdict
+from collections import defaultdict, deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 
 from athena.core.config import (
     PROJECT_ROOT,
@@ -39,6 +50,7 @@ from athena.memory.vectors import (
     search_entities,
     search_user_profile,
     search_system_docs,
+    search_all,
 )
 from athena.tools.reranker import rerank_results
 
@@ -54,7 +66,7 @@ WEIGHTS = {
     "graphrag": 2.5,  # The Context (community/entity graph)
     "user_profile": 2.5,  # User profile data (vector search)
     "framework": 2.3,  # Strategic frameworks (vector search)
-    "tags": 2.2,  # The Index (keyword grep on TAG_INDEX)
+    "tags": 2.2,  # The Index (keyword match on TAG_INDEX)
     "vector": 1.8,  # Fallback for unlisted vector subtypes
     "capability": 1.8,  # Capability docs (vector search)
     "playbook": 1.8,  # Playbook docs (vector search)
@@ -69,6 +81,8 @@ RRF_K = 60
 CONFIDENCE_HIGH = 0.03
 CONFIDENCE_MED = 0.02
 CONFIDENCE_LOW = 0.01
+RERANK_CANDIDATES = 25
+RRF_VECTORIZE_MIN = 50  # Per-source list length at which NumPy beats the Python loop
 
 # GraphRAG paths
 GRAPHRAG_DIR = AGENT_DIR / "graphrag"
@@ -76,9 +90,91 @@ COMMUNITIES_FILE = GRAPHRAG_DIR / "communities.json"
 GRAPH_FILE = GRAPHRAG_DIR / "knowledge_graph.gpickle"
 CHROMA_DIR = AGENT_DIR / "chroma_db"
 
+# CANONICAL.md kept between queries:
+# (mtime, raw lines, lowercased lines, lowercased text, line start offsets in that text)
+_CANONICAL_CACHE: tuple[float, list[str], list[str], str, list[int]] | None = None
+CANONICAL_MAX_RESULTS = 5
+# From this many keywords on, one regex scan of the text beats per-line substring checks
+CANONICAL_REGEX_MIN_KEYWORDS = 3
+
+# Tag index shards kept in memory between queries: path -> (mtime, lines)
+_TAG_SHARD_CACHE: dict[Path, tuple[float, list[str]]] = {}
+TAG_MATCHES_PER_SHARD = 10
+
+# Directories never descended into by the filename walk
+FILENAME_PRUNE = frozenset({".git", "node_modules", ".venv", "__pycache__"})
+# Wall-clock budget for the walk (the old `find` call's timeout), so a huge tree or a
+# PROJECT_ROOT that fell back to a broad CWD can't hold a collection worker indefinitely
+FILENAME_WALK_TIMEOUT = 2.0
+
+# Global wait for all collectors in one run_search (seconds)
+COLLECTION_TIMEOUT = 8
+
+# One SQLite connection per collection pool worker, reused across queries
+_SQLITE_TL = threading.local()
+_SQLITE_CONNS = []  # pooled connections (at most one per worker), for atexit cleanup
+
+
+def _mark_collection_worker():
+    """_COLLECTION_POOL initializer: lets _sqlite_connection keep this thread's connection."""
+    _SQLITE_TL.pooled = True
+
+
+# Long-lived worker pools shared across run_search calls: no per-query thread
+# start-up, and workers keep their thread-local Supabase clients warm.
+# Sized for several searches' 6 collectors at once (threads start lazily), so
+# stragglers left running by a timed-out search don't queue the next one.
+_COLLECTION_POOL = ThreadPoolExecutor(
+    max_workers=24, thread_name_prefix="athena-collect", initializer=_mark_collection_worker
+)
+_VECTOR_POOL = ThreadPoolExecutor(max_workers=11, thread_name_prefix="athena-vec")
+atexit.register(_COLLECTION_POOL.shutdown, wait=False)
+atexit.register(_VECTOR_POOL.shutdown, wait=False)
+
+# Whether the database has rpc_search_all (supabase/migrations); cleared the first
+# time PostgREST reports it missing, so later queries go straight to the per-type RPCs
+_SEARCH_ALL_AVAILABLE = True
+_RPC_NOT_FOUND_CODES = frozenset({"PGRST202", "42883"})  # PostgREST / Postgres "no such function"
+
 # --- Collection Functions ---
 
 
+def _load_canonical() -> tuple[float, list[str], list[str], str, list[int]]:
+    """Read and lowercase CANONICAL.md once, reusing the result while mtime is unchanged."""
+    global _CANONICAL_CACHE
+    mtime = CANONICAL_PATH.stat().st_mtime
+    if _CANONICAL_CACHE is not None and _CANONICAL_CACHE[0] == mtime:
+        return _CANONICAL_CACHE
+
+    raw_lines = CANONICAL_PATH.read_text(encoding="utf-8", errors="replace").split("\n")
+    lower_lines = [line.lower() for line in raw_lines]
+    lower_text = "\n".join(lower_lines)
+    line_starts = list(accumulate((len(line) + 1 for line in lower_lines[:-1]), initial=0))
+    _CANONICAL_CACHE = (mtime, raw_lines, lower_lines, lower_text, line_starts)
+    return _CANONICAL_CACHE
+
+
+def _canonical_matches(keywords: list[str], lower_lines, lower_text, line_starts):
+    """Yield indices of lines containing any of the (lowercased) keywords, in order."""
+    if len(keywords) >= CANONICAL_REGEX_MIN_KEYWORDS:
+        # One C-level scan for any keyword, jumping to the next line after each hit
+        pattern = re.compile("|".join(map(re.escape, keywords)))
+        pos = 0
+        while True:
+            match = pattern.search(lower_text, pos)
+            if match is None:
+                return
+            idx = bisect_right(line_starts, match.start()) - 1
+            yield idx
+            if idx + 1 >= len(line_starts):
+                return
+            pos = line_starts[idx + 1]
+    else:
+        for idx, line in enumerate(lower_lines):
+            if any(kw in line for kw in keywords):
+                yield idx
+
+
 def collect_canonical(query: str) -> list[SearchResult]:
     """Collect matches from CANONICAL.md"""
     results = []
@@ -86,36 +182,51 @@ def collect_canonical(query: str) -> list[SearchResult]:
         return []
 
     keywords = [
-        w for w in query.split() if len(w) >= 2 and w.lower() not in ["the", "and", "for", "is"]
+        w for w in query.lower().split() if len(w) >= 2 and w not in ["the", "and", "for", "is"]
     ]
     if not keywords:
         return []
 
     try:
-        text = CANONICAL_PATH.read_text(encoding="utf-8")
-        for line_num, line in enumerate(text.splitlines(), 1):
-            if any(k.lower() in line.lower() for k in keywords):
-                if "|" in line and "http" not in line:
-                    results.append(
-                        SearchResult(
-                            id=f"Canonical:L{line_num}",
-                            content=line.strip(),
-                            source="canonical",
-                            score=1.0,
-                        )
+        _, raw_lines, lower_lines, lower_text, line_starts = _load_canonical()
+        for idx in _canonical_matches(keywords, lower_lines, lower_text, line_starts):
+            line = raw_lines[idx]
+            line_num = idx + 1
+
+            if "|" in line and "http" not in line:
+                results.append(
+                    SearchResult(
+                        id=f"Canonical:L{line_num}",
+                        content=line.strip(),
+                        source="canonical",
+                        score=1.0,
                     )
-                elif "##" in line:
-                    results.append(
-                        SearchResult(
-                            id=f"Canonical:Header:L{line_num}",
-                            content=line.strip(),
-                            source="canonical",
-                            score=0.9,
-                        )
+                )
+            elif "##" in line:
+                results.append(
+                    SearchResult(
+                        id=f"Canonical:Header:L{line_num}",
+                        content=line.strip(),
+                        source="canonical",
+                        score=0.9,
                     )
+                )
+            if len(results) >= CANONICAL_MAX_RESULTS:
+                break
     except Exception:
         pass
-    return results[:5]
+    return results
+
+
+def _read_tag_shard(path: Path) -> list[str]:
+    """Return a tag index shard's lines, re-reading the file only when its mtime changes."""
+    mtime = path.stat().st_mtime
+    cached = _TAG_SHARD_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+    _TAG_SHARD_CACHE[path] = (mtime, lines)
+    return lines
 
 
 def collect_tags(query: str) -> list[SearchResult]:
@@ -127,31 +238,26 @@ def collect_tags(query: str) -> list[SearchResult]:
     if not any(p.exists() for p in index_paths) and TAG_INDEX_PATH.exists():
         index_paths = [TAG_INDEX_PATH]
 
+    # In-process scan (no grep fork/exec per query); query is matched literally
+    pattern = re.compile(re.escape(query), re.IGNORECASE)
+
     for path in index_paths:
-        if not path.exists():
+        try:
+            lines = _read_tag_shard(path)
+        except OSError:
             continue
 
-        try:
-            # Use grep for speed — argument list prevents shell injection
-            process = subprocess.run(
-                ["grep", "-i", "-m", "10", query, str(path)],
-                capture_output=True,
-                text=True,
-                timeout=5,
+        matches = islice((line for line in lines if pattern.search(line)), TAG_MATCHES_PER_SHARD)
+        for i, line in enumerate(matches):
+            tag, sep, _ = line.partition("|")
+            results.append(
+                SearchResult(
+                    id=f"Tag:{tag.strip() if sep else query}",
+                    content=line.strip(),
+                    source="tags",
+                    score=1.0 - (i * 0.05),
+                )
             )
-            if process.stdout:
-                lines = process.stdout.strip().split("\n")
-                for i, line in enumerate(lines):
-                    results.append(
-                        SearchResult(
-                            id=f"Tag:{line.split('|')[0].strip() if '|' in line else query}",
-                            content=line.strip(),
-                            source="tags",
-                            score=1.0 - (i * 0.05),
-                        )
-                    )
-        except Exception:
-            pass
     return results
 
 
@@ -159,12 +265,13 @@ def collect_vectors(
     query: str, limit: int = 20, embedding: list[float] | None = None
 ) -> list[SearchResult]:
     """Collect semantic matches via Supabase"""
+    global _SEARCH_ALL_AVAILABLE
     results = []
     try:
         # client = get_client()  # Singleton initialization (Moved to threading.local)
         query_embedding = embedding if embedding else get_embedding(query)
 
-        # Parallel search using ThreadPoolExecutor
+        # Parallel search on the shared vector pool
         search_tasks = [
             ("protocol", search_protocols, 10, 0.3),
             ("case_study", search_case_studies, 10, 0.3),
@@ -191,14 +298,33 @@ def collect_vectors(
                 print(f"   ⚠️ Search failed for {type_label}: {e}", file=sys.stderr)
                 return type_label, []
 
-        with ThreadPoolExecutor(max_workers=len(search_tasks)) as executor:
-            task_results = list(executor.map(run_task, search_tasks))
+        limits = {
+            type_label: {"count": limit, "threshold": threshold}
+            for type_label, _, limit, threshold in search_tasks
+        }
+        task_results = None
+        if _SEARCH_ALL_AVAILABLE:
+            try:
+                # One round-trip for every type; rows come back tagged with their type
+                rows = search_all(get_client(), query_embedding, limits)
+            except Exception as e:
+                if getattr(e, "code", None) not in _RPC_NOT_FOUND_CODES:
+                    raise
+                # Database without rpc_search_all yet: fan out per type from now on
+                _SEARCH_ALL_AVAILABLE = False
+            else:
+                grouped = defaultdict(list)
+                for row in rows:
+                    grouped[row["type"]].append(row["data"])
+                for type_rows in grouped.values():
+                    type_rows.sort(key=lambda item: item.get("similarity", 0), reverse=True)
+                task_results = grouped.items()
+        if task_results is None:
+            task_results = list(_VECTOR_POOL.map(run_task, search_tasks))
 
         for type_label, raw_results in task_results:
             for item in raw_results or []:
-                path = item.get("file_path", "")
-                if "?" in path:
-                    path = path.split("?")[0]
+                path = item.get("file_path", "").partition("?")[0]
 
                 # Dynamic Title/ID construction
                 item_id = (
@@ -219,10 +345,10 @@ def collect_vectors(
                 results.append(
                     SearchResult(
                         id=item_id,
-                        content=item.get("content", "")[:200],
+                        content="",  # Snippet is cut in weighted_rrf, for winners only
                         source=type_label,  # Use actual type for correct RRF weighting
                         score=item.get("similarity", 0),
-                        metadata={"type": type_label, "path": path},
+                        metadata={"type": type_label, "path": path, "_raw_content_ref": item},
                     )
                 )
 
@@ -232,27 +358,30 @@ def collect_vectors(
     return results
 
 
-def collect_graphrag(query: str, limit: int = 5) -> list[SearchResult]:
-    """Collect entity and community matches via query_graphrag.py subprocess."""
-    results = []
-
-    # Path to query script
+@functools.lru_cache(maxsize=1)
+def _load_graphrag_module():
+    """Import the project's query_graphrag.py once (it lives outside the package)."""
     script_path = PROJECT_ROOT / ".agent" / "scripts" / "query_graphrag.py"
     if not script_path.exists():
-        return []
+        return None
+    spec = importlib.util.spec_from_file_location("athena_query_graphrag", script_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
 
-    try:
-        # Run query_graphrag.py with --json flag
-        # Optimization: Use --global-only to skip slow model loading
-        cmd = ["python3", str(script_path), query, "--json", "--global-only"]
 
-        # Add strict timeout
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False, timeout=5)
+def collect_graphrag(query: str, limit: int = 5) -> list[SearchResult]:
+    """Collect entity and community matches via query_graphrag.run_query (in-process)."""
+    results = []
 
-        if result.returncode != 0:
+    try:
+        module = _load_graphrag_module()
+        if module is None:
             return []
 
-        data = json.loads(result.stdout)
+        # Same process, no interpreter start-up or JSON round trip. Runs on the
+        # collection pool, so run_search's global timeout still bounds it.
+        data = module.run_query(query)
 
         for item in data:
             # Skip vectors (handled by collect_vectors via Supabase/Chroma)
@@ -307,54 +436,142 @@ def collect_graphrag(query: str, limit: int = 5) -> list[SearchResult]:
     return results[:limit]
 
 
+def _walk_for_name(
+    root: Path,
+    needle: str,
+    limit: int = 5,
+    prune: frozenset[str] = FILENAME_PRUNE,
+    timeout: float = FILENAME_WALK_TIMEOUT,
+) -> list[tuple[str, str]]:
+    """
+    Breadth-first scandir walk returning up to `limit` (name, path) pairs for files
+    whose name contains `needle` (case-insensitive), never descending into `prune` dirs.
+    Stops after `timeout` seconds with whatever it has found so far.
+
+    Only DirEntry strings and its cached d_type are used, so non-matching
+    entries cost no stat call and no Path allocation.
+    """
+    needle = needle.lower()
+    matches: list[tuple[str, str]] = []
+    pending = deque([os.fspath(root)])
+    deadline = time.monotonic() + timeout
+    while pending and time.monotonic() < deadline:
+        try:
+            with os.scandir(pending.popleft()) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in prune:
+                            pending.append(entry.path)
+                    elif needle in name.lower() and entry.is_file(follow_symlinks=False):
+                        matches.append((name, entry.path))
+                        if len(matches) == limit:
+                            return matches
+        except OSError:
+            continue
+    return matches
+
+
 def collect_filenames(query: str) -> list[SearchResult]:
     """Collect filename matches in Project Root"""
     results = []
     try:
-        # Use argument list (no shell=True) to prevent shell injection
-        process = subprocess.run(
-            [
-                "find",
-                ".",
-                "-path",
-                "./node_modules",
-                "-prune",
-                "-o",
-                "-path",
-                "./.git",
-                "-prune",
-                "-o",
-                "-type",
-                "f",
-                "-name",
-                f"*{query}*",
-                "-print",
-            ],
-            cwd=PROJECT_ROOT,
-            capture_output=True,
-            text=True,
-            timeout=2,
-        )
-        if process.stdout:
-            lines = process.stdout.strip().split("\n")[:5]  # Limit to 5
-            for line in lines:
-                if line.strip():
-                    # line is relative to PROJECT_ROOT
-                    full_path = PROJECT_ROOT / line
-                    results.append(
-                        SearchResult(
-                            id=f"File: {full_path.name}",
-                            content=f"Path: {line}",
-                            source="filename",
-                            score=1.0,
-                            metadata={"path": str(full_path)},
-                        )
-                    )
+        # In-process walk: no find fork/exec, no timeout race on large trees.
+        # Walk paths all start with "<root>/", so the relative part is a slice.
+        prefix_len = len(os.fspath(PROJECT_ROOT)) + 1
+        for name, path in _walk_for_name(PROJECT_ROOT, query):
+            results.append(
+                SearchResult(
+                    id=f"File: {name}",
+                    content=f"Path: ./{path[prefix_len:]}",
+                    source="filename",
+                    score=1.0,
+                    metadata={"path": path},
+                )
+            )
     except Exception:
         pass
     return results
 
 
+def _open_sqlite(db_path: Path):
+    import sqlite3
+
+    conn = sqlite3.connect(str(db_path), check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.executescript("PRAGMA mmap_size=268435456; PRAGMA cache_size=-8192; PRAGMA query_only=ON;")
+    return conn
+
+
+@contextlib.contextmanager
+def _sqlite_connection(db_path: Path):
+    """
+    Read-only connection to `db_path`. _COLLECTION_POOL workers keep theirs for
+    reuse; any other thread (e.g. agentic_search's short-lived executors) gets a
+    connection that is closed after use, so nothing outlives its thread.
+    """
+    if not getattr(_SQLITE_TL, "pooled", False):
+        conn = _open_sqlite(db_path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+        return
+
+    conn = getattr(_SQLITE_TL, "conn", None)
+    if conn is None or _SQLITE_TL.path != db_path:
+        if conn is not None:
+            _SQLITE_CONNS.remove(conn)
+            conn.close()
+        conn = _open_sqlite(db_path)
+        _SQLITE_TL.conn, _SQLITE_TL.path = conn, db_path
+        _SQLITE_CONNS.append(conn)
+    yield conn
+
+
+def _close_sqlite_connections():
+    for conn in _SQLITE_CONNS:
+        with contextlib.suppress(Exception):
+            conn.close()
+
+
+atexit.register(_close_sqlite_connections)
+
+# Path/name matches (kind='file') followed by tag matches (kind='tag'), one round-trip
+_SQLITE_LIKE_QUERY = """
+    SELECT 'file' AS kind, path, NULL AS name
+    FROM (SELECT path FROM files WHERE path LIKE ? LIMIT ?)
+    UNION ALL
+    SELECT 'tag' AS kind, path, name
+    FROM (
+        SELECT f.path, t.name
+        FROM files f
+        JOIN file_tags ft ON f.path = ft.file_path
+        JOIN tags t ON ft.tag_id = t.id
+        WHERE t.name LIKE ?
+        LIMIT ?
+    )
+"""
+
+# Same shape via the FTS5 trigram tables (files_fts over files.path, tags_fts over
+# tags.name): substring matches like %query% but served by the index, no full scan
+_SQLITE_FTS_QUERY = """
+    SELECT 'file' AS kind, path, NULL AS name
+    FROM (SELECT path FROM files_fts WHERE files_fts MATCH ? LIMIT ?)
+    UNION ALL
+    SELECT 'tag' AS kind, path, name
+    FROM (
+        SELECT f.path, t.name
+        FROM tags_fts
+        JOIN tags t ON t.id = tags_fts.rowid
+        JOIN file_tags ft ON ft.tag_id = t.id
+        JOIN files f ON f.path = ft.file_path
+        WHERE tags_fts MATCH ?
+        LIMIT ?
+    )
+"""
+
+
 def collect_sqlite(query: str, limit: int = 10) -> list[SearchResult]:
     """Sovereign Fallback: Search the local SQLite index (athena.db)."""
     import sqlite3
@@ -366,53 +583,47 @@ def collect_sqlite(query: str, limit: int = 10) -> list[SearchResult]:
 
     results = []
     try:
-        conn = sqlite3.connect(str(db_path))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        # Keyword search on tags and filenames
-        query_sanitized = f"%{query}%"
-
-        # 1. Search Files by Path/Name
-        cursor.execute("SELECT path FROM files WHERE path LIKE ? LIMIT ?", (query_sanitized, limit))
-        for row in cursor.fetchall():
+        with _sqlite_connection(db_path) as conn:
+            # Keyword search on tags and filenames
+            rows = None
+            if len(query) >= 3:  # Trigram index can't match anything shorter
+                phrase = '"' + query.replace('"', '""') + '"'
+                try:
+                    rows = conn.execute(
+                        _SQLITE_FTS_QUERY, (phrase, limit, phrase, limit)
+                    ).fetchall()
+                except sqlite3.OperationalError:
+                    pass  # Index built without the FTS tables: fall back to LIKE
+            if rows is None:
+                query_sanitized = f"%{query}%"
+                rows = conn.execute(
+                    _SQLITE_LIKE_QUERY, (query_sanitized, limit, query_sanitized, limit)
+                ).fetchall()
+
+        for row in rows:
             filepath = Path(row["path"])
-            results.append(
-                SearchResult(
-                    id=f"Local:File:{filepath.name}",
-                    content=f"Local match: {filepath.name}",
-                    source="sqlite",
-                    score=0.8,
-                    metadata={"path": str(filepath)},
+            if row["kind"] == "file":
+                # 1. Files by Path/Name
+                results.append(
+                    SearchResult(
+                        id=f"Local:File:{filepath.name}",
+                        content=f"Local match: {filepath.name}",
+                        source="sqlite",
+                        score=0.8,
+                        metadata={"path": str(filepath)},
+                    )
                 )
-            )
-
-        # 2. Search by Tags
-        cursor.execute(
-            """
-            SELECT f.path, t.name 
-            FROM files f
-            JOIN file_tags ft ON f.path = ft.file_path
-            JOIN tags t ON ft.tag_id = t.id
-            WHERE t.name LIKE ?
-            LIMIT ?
-        """,
-            (query_sanitized, limit),
-        )
-
-        for row in cursor.fetchall():
-            filepath = Path(row["path"])
-            results.append(
-                SearchResult(
-                    id=f"Local:Tag:{row['name']}:{filepath.name}",
-                    content=f"Tag match: #{row['name']}",
-                    source="sqlite",
-                    score=0.9,
-                    metadata={"path": str(filepath)},
+            else:
+                # 2. Files by Tags
+                results.append(
+                    SearchResult(
+                        id=f"Local:Tag:{row['name']}:{filepath.name}",
+                        content=f"Tag match: #{row['name']}",
+                        source="sqlite",
+                        score=0.9,
+                        metadata={"path": str(filepath)},
+                    )
                 )
-            )
-
-        conn.close()
     except Exception as e:
         print(f"   ⚠️ SQLite fallback failed: {e}", file=sys.stderr)
 
@@ -422,31 +633,62 @@ def collect_sqlite(query: str, limit: int = 10) -> list[SearchResult]:
 # --- Fusion Logic ---
 
 
-def weighted_rrf(ranked_lists: dict[str, list[SearchResult]], k: int = 60) -> list[SearchResult]:
+def _rrf_contributions(docs: list[SearchResult], weight: float, k: int) -> list[float]:
+    """Per-rank RRF contributions: weight * (0.5 + score) / (k + rank)."""
+    if len(docs) >= RRF_VECTORIZE_MIN:
+        try:
+            import numpy as np
+        except ImportError:
+            pass
+        else:
+            scores = np.fromiter((d.score for d in docs), dtype=np.float64, count=len(docs))
+            ranks = np.arange(1, len(docs) + 1, dtype=np.float64)
+            return (weight * (0.5 + scores) * (1.0 / (k + ranks))).tolist()
+
+    # 0.5 + score ranges 0.5 to 1.5: a dynamic modifier on the plain 1 / (k + rank)
+    return [weight * (0.5 + d.score) * (1.0 / (k + rank)) for rank, d in enumerate(docs, start=1)]
+
+
+def weighted_rrf(
+    ranked_lists: dict[str, list[SearchResult]],
+    k: int = 60,
+    top_n: int | None = None,
+) -> list[SearchResult]:
     fused_scores = defaultdict(float)
     doc_map = {}
-    doc_signals = defaultdict(dict)
+    contribs_per_id = defaultdict(list)  # id -> [(source, rank, contrib)]
 
     for source, docs in ranked_lists.items():
         weight = WEIGHTS.get(source, 1.0)
-        for rank, doc in enumerate(docs, start=1):
-            score_mod = 0.5 + doc.score  # Dynamic: range 0.5 to 1.5
-            contrib = weight * score_mod * (1.0 / (k + rank))
+        contribs = _rrf_contributions(docs, weight, k)
+        for rank, (doc, contrib) in enumerate(zip(docs, contribs), start=1):
             fused_scores[doc.id] += contrib
 
             if doc.id not in doc_map:
                 doc_map[doc.id] = doc
 
-            doc_signals[doc.id][source] = {"rank": rank, "contrib": round(contrib, 5)}
+            contribs_per_id[doc.id].append((source, rank, contrib))
+
+    # Only the top_n survive downstream: select them in O(n log top_n), no full sort
+    if top_n is not None:
+        winners = heapq.nlargest(top_n, fused_scores.items(), key=itemgetter(1))
+    else:
+        winners = sorted(fused_scores.items(), key=itemgetter(1), reverse=True)
 
     final_list = []
-    for doc_id, score in fused_scores.items():
+    for doc_id, score in winners:
         doc = doc_map[doc_id]
         doc.rrf_score = score
-        doc.signals = doc_signals[doc_id]
+        raw = doc.metadata.pop("_raw_content_ref", None)
+        if raw is not None:
+            doc.content = raw.get("content", "")[:200]
+        # Signal dicts are only built for the docs that survive the cut
+        doc.signals = {
+            src: {"rank": r, "contrib": round(c, 5)} for src, r, c in contribs_per_id[doc_id]
+        }
         final_list.append(doc)
 
-    return sorted(final_list, key=lambda x: x.rrf_score, reverse=True)
+    return final_list
 
 
 # --- Main Entry Point ---
@@ -463,36 +705,31 @@ def run_search(
     # 0. Check cache first
     cache = get_search_cache()
     cache_key = f"{query}|{limit}|{strict}|{rerank}"
-    cached_results = cache.get(cache_key)
+    fused_results = cache.get(cache_key)
+    query_embedding = None
 
-    if cached_results is not None:
+    if fused_results is not None:
         if not json_output:
             print(f'\n⚡ CACHE HIT: "{query}"')
             print("=" * 60)
-        fused_results = cached_results
     else:
         # 0.5. Check Semantic Cache (if miss on exact)
-        query_embedding = None
         if not json_output:
             print("   ⚡ Checking semantic cache...")
 
+        # The embedding serves both the semantic check and the vector collector
         try:
-            # We need the embedding for semantic check
-            # This corresponds to "Step 2: Fetch embedding" in the plan
             query_embedding = get_embedding(query)
-            semantic_hit = cache.get_semantic(query_embedding)
-
-            if semantic_hit:
-                if not json_output:
-                    print(f'🔥 SEMANTIC CACHE HIT: "{query}"')
-                    print("=" * 60)
-                fused_results = semantic_hit
-                # Proceed to display (skip collection)
-                pass
-            else:
-                raise ValueError("Semantic Miss")
         except Exception:
-            # Fallback to full search
+            pass
+        semantic_hit = cache.get_semantic(query_embedding) if query_embedding else None
+
+        if semantic_hit:
+            if not json_output:
+                print(f'🔥 SEMANTIC CACHE HIT: "{query}"')
+                print("=" * 60)
+            fused_results = semantic_hit
+        else:
             if not json_output:
                 print(
                     f'\n🔍 SMART SEARCH (Parallel Hybrid RRF{" + Rerank" if rerank else ""}): "{query}"'
@@ -510,12 +747,12 @@ def run_search(
             }
 
             lists = {}
-            with ThreadPoolExecutor(max_workers=len(collection_tasks)) as executor:
-                future_to_source = {
-                    executor.submit(func): source for source, func in collection_tasks.items()
-                }
-                # Wait for results with a global timeout
-                for future in as_completed(future_to_source, timeout=8):
+            future_to_source = {
+                _COLLECTION_POOL.submit(func): source for source, func in collection_tasks.items()
+            }
+            # Wait for results with a global timeout
+            try:
+                for future in as_completed(future_to_source, timeout=COLLECTION_TIMEOUT):
                     source = future_to_source[future]
                     try:
                         lists[source] = future.result()
@@ -523,6 +760,15 @@ def run_search(
                         if not json_output:
                             print(f"   ⚠️ {source} failed: {e}", file=sys.stderr)
                         lists[source] = []
+            except FuturesTimeoutError:
+                # Fuse what arrived; unstarted collectors are cancelled so they
+                # don't occupy shared workers after this search has moved on
+                for future, source in future_to_source.items():
+                    if not future.done():
+                        future.cancel()
+                        if not json_output:
+                            print(f"   ⚠️ {source} timed out", file=sys.stderr)
+                        lists[source] = []
 
             # 2. Fuse
             # Split vector results by their type-specific source for correct
@@ -534,21 +780,23 @@ def run_search(
                     lists[type_key] = []
                 lists[type_key].append(item)
 
-            fused_results = weighted_rrf(lists)
+            # Keep what is displayed, or the rerank candidate pool if larger.
+            # Strict mode counts every fused candidate below CONFIDENCE_MED, so keep them all.
+            if strict:
+                top_n = None
+            else:
+                top_n = max(limit, RERANK_CANDIDATES) if rerank else limit
+            fused_results = weighted_rrf(lists, top_n=top_n)
 
         # 3. Rerank
         if rerank and fused_results:
-            candidates = fused_results[:25]
+            candidates = fused_results[:RERANK_CANDIDATES]
             if not json_output:
                 print(f"   ⚡ Reranking top {len(candidates)} candidates...")
             fused_results = rerank_results(query, candidates, top_k=limit)
 
-        # Cache the result (Exact + Semantic)
-        if fused_results and query_embedding:
-            cache.set(query, fused_results, embedding=query_embedding)
-
-        # Store in cache for next time
-        cache.set(cache_key, fused_results)
+        # Store in cache for next time (the embedding makes it a semantic entry too)
+        cache.set(cache_key, fused_results, embedding=query_embedding if fused_results else None)
 
     # 4. Filter
     if strict:
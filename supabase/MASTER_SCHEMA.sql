@@ -163,6 +163,7 @@ CREATE INDEX IF NOT EXISTS idx_entities_embedding ON entities USING ivfflat (emb
 -- ==============================================================================
 -- [Functions omitted for brevity here, but included in the SQL script provided to user]
 -- Reference migrate_complete_3072.sql for full function definitions.
+-- Batched rpc_search_all: supabase/migrations/20261015000000_rpc_search_all.sql
 -- ==============================================================================
 -- 4. PERMISSIONS
 -- ==============================================================================
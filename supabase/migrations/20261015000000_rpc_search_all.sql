@@ -0,0 +1,102 @@
+-- ==============================================================================
+-- rpc_search_all: every per-type search_* function in one round-trip.
+-- ==============================================================================
+-- Requires the search_* functions (migrate_complete_3072.sql) to exist already:
+-- SQL function bodies are validated at CREATE time.
+--
+-- limits = {"<type>": {"count": n, "threshold": t}, ...}; types left out are skipped.
+CREATE OR REPLACE FUNCTION rpc_search_all(
+        query_embedding vector(3072),
+        limits JSONB DEFAULT '{}'::JSONB
+    ) RETURNS TABLE (type TEXT, data JSONB) LANGUAGE sql STABLE AS $$
+SELECT 'protocol',
+    to_jsonb(r)
+FROM search_protocols(
+        query_embedding,
+        COALESCE((limits->'protocol'->>'threshold')::FLOAT, 0.3),
+        COALESCE((limits->'protocol'->>'count')::INT, 0)
+    ) r
+UNION ALL
+SELECT 'case_study',
+    to_jsonb(r)
+FROM search_case_studies(
+        query_embedding,
+        COALESCE((limits->'case_study'->>'threshold')::FLOAT, 0.3),
+        COALESCE((limits->'case_study'->>'count')::INT, 0)
+    ) r
+UNION ALL
+SELECT 'session',
+    to_jsonb(r)
+FROM search_sessions(
+        query_embedding,
+        COALESCE((limits->'session'->>'threshold')::FLOAT, 0.3),
+        COALESCE((limits->'session'->>'count')::INT, 0)
+    ) r
+UNION ALL
+SELECT 'capability',
+    to_jsonb(r)
+FROM search_capabilities(
+        query_embedding,
+        COALESCE((limits->'capability'->>'threshold')::FLOAT, 0.3),
+        COALESCE((limits->'capability'->>'count')::INT, 0)
+    ) r
+UNION ALL
+SELECT 'playbook',
+    to_jsonb(r)
+FROM search_playbooks(
+        query_embedding,
+        COALESCE((limits->'playbook'->>'threshold')::FLOAT, 0.3),
+        COALESCE((limits->'playbook'->>'count')::INT, 0)
+    ) r
+UNION ALL
+SELECT 'workflow',
+    to_jsonb(r)
+FROM search_workflows(
+        query_embedding,
+        COALESCE((limits->'workflow'->>'threshold')::FLOAT, 0.3),
+        COALESCE((limits->'workflow'->>'count')::INT, 0)
+    ) r
+UNION ALL
+SELECT 'entity',
+    to_jsonb(r)
+FROM search_entities(
+        query_embedding,
+        COALESCE((limits->'entity'->>'threshold')::FLOAT, 0.3),
+        COALESCE((limits->'entity'->>'count')::INT, 0)
+    ) r
+UNION ALL
+SELECT 'reference',
+    to_jsonb(r)
+FROM search_references(
+        query_embedding,
+        COALESCE((limits->'reference'->>'threshold')::FLOAT, 0.3),
+        COALESCE((limits->'reference'->>'count')::INT, 0)
+    ) r
+UNION ALL
+SELECT 'framework',
+    to_jsonb(r)
+FROM search_frameworks(
+        query_embedding,
+        COALESCE((limits->'framework'->>'threshold')::FLOAT, 0.3),
+        COALESCE((limits->'framework'->>'count')::INT, 0)
+    ) r
+UNION ALL
+SELECT 'user_profile',
+    to_jsonb(r)
+FROM search_user_profile(
+        query_embedding,
+        COALESCE((limits->'user_profile'->>'threshold')::FLOAT, 0.3),
+        COALESCE((limits->'user_profile'->>'count')::INT, 0)
+    ) r
+UNION ALL
+SELECT 'system_doc',
+    to_jsonb(r)
+FROM search_system_docs(
+        query_embedding,
+        COALESCE((limits->'system_doc'->>'threshold')::FLOAT, 0.3),
+        COALESCE((limits->'system_doc'->>'count')::INT, 0)
+    ) r;
+$$;
+GRANT EXECUTE ON FUNCTION rpc_search_all(vector, JSONB) TO anon,
+    authenticated,
+    service_role;